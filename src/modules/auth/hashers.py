@@ -3,26 +3,26 @@ import hashlib
 import hmac
 import secrets
 import string
-import uuid
 import logging
 from typing import ClassVar, Callable, Any
 
 logger = logging.getLogger(__name__)
+_SALT_ALLOWED_CHARS = string.ascii_letters + string.digits
 
 
 def get_salt(length: int = 12) -> str:
     """Returns a securely generated random string."""
 
-    allowed_chars = string.ascii_letters + string.digits
-    return "".join(secrets.choice(allowed_chars) for _ in range(length))
+    return "".join([secrets.choice(_SALT_ALLOWED_CHARS) for _ in range(length)])
 
 
 def get_random_hash(size: int) -> str:
     """Allows calculating random hash with fixed length"""
 
-    hash_value = hashlib.blake2b(key=get_salt().encode(), digest_size=size)
-    hash_value.update(str(uuid.uuid4()).encode())
-    return hash_value.hexdigest()[:size]
+    if not 1 <= size <= 64:
+        raise ValueError("size must be between 1 and 64")
+
+    return secrets.token_hex((size + 1) // 2)[:size]
 
 
 class PBKDF2PasswordHasher:
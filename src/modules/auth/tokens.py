@@ -24,6 +24,8 @@ __all__ = (
 from src.utils import cut_string
 
 type JWT_PAYLOAD_RAW_T = dict[str, str | int | datetime.datetime]
+# header part of JWT depends only on the signing algorithm (cached per algorithm)
+_JWT_HEADER_PARTS: dict[str, str] = {}
 
 
 class GeneratedToken(NamedTuple):
@@ -76,6 +78,18 @@ def jwt_decode(jwt_token: str, settings: SettingsDep) -> JWTPayload:
     )
 
 
+def _get_jwt_header_part(settings: SettingsDep) -> str:
+    """
+    Returns header part of JWT token for current algorithm (API tokens are issued without it).
+    """
+    algorithm = settings.jwt_algorithm
+    if (header_part := _JWT_HEADER_PARTS.get(algorithm)) is None:
+        just_for_header_token = jwt_encode(payload=JWTPayload(sub="example"), settings=settings)
+        header_part = _JWT_HEADER_PARTS[algorithm] = just_for_header_token.split(".", 1)[0]
+
+    return header_part
+
+
 def make_api_token(
     expires_at: datetime.datetime | None,
     settings: SettingsDep,
@@ -136,8 +150,7 @@ def decode_api_token(token: str, settings: SettingsDep) -> JWTPayload:
         PayloadTokenInfo - payload of the token
     """
     logger.debug("[auth] Decoding token: '%s'", token)
-    just_for_header_token = jwt_encode(payload=JWTPayload(sub="example"), settings=settings)
-    header_part, _, _ = just_for_header_token.split(".")
+    header_part = _get_jwt_header_part(settings)
     token, sign_len_prefix = token[:-3], token[-3:]  # last 3 symbols contain len of signature
     if not sign_len_prefix.isnumeric():
         logger.error("[auth] Unexpected sign len prefix detected: '%s'", sign_len_prefix)
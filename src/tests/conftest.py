@@ -7,6 +7,7 @@ from starlette.testclient import TestClient
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from src.db import initialize_database
+from src.db.repositories import TokenRepository, VendorRepository
 from src.main import make_app, CodeAgentAPP
 from src.modules.auth.tokens import make_api_token
 from src.settings import AppSettings, get_app_settings
@@ -23,20 +24,31 @@ MINIMAL_ENV_VARS = {
     "ADMIN_PASSWORD": "test-password",
     "VENDOR_ENCRYPTION_KEY": "test-encryption-key",
 }
+TEST_APP_SECRET_KEY = SecretStr("example-UStLb8mds9K")
+TEST_VENDOR_ENCRYPTION_KEY = SecretStr("test-encryption-key")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_user() -> MockUser:
     return MockUser(id=1, is_active=True, username="test-user")
 
 
+@pytest.fixture(scope="session")
+def _app_settings_proto() -> AppSettings:
+    # built before the function-scoped `minimal_env_vars`, so patch env (and skip .env) here too
+    with patch.dict(os.environ, MINIMAL_ENV_VARS):
+        return AppSettings(
+            _env_file=None,
+            http_proxy_url=None,
+            app_secret_key=TEST_APP_SECRET_KEY,
+            vendor_encryption_key=TEST_VENDOR_ENCRYPTION_KEY,
+        )
+
+
 @pytest.fixture
-def app_settings_test() -> AppSettings:
-    return AppSettings(
-        http_proxy_url=None,
-        app_secret_key=SecretStr("example-UStLb8mds9K"),
-        vendor_encryption_key=SecretStr("test-encryption-key"),
-    )
+def app_settings_test(_app_settings_proto: AppSettings) -> AppSettings:
+    # some tests tweak settings in place (proxy url, flags), so hand out a deep copy
+    return _app_settings_proto.model_copy(deep=True)
 
 
 @pytest.fixture(autouse=True)
@@ -61,9 +73,7 @@ def auth_test_token(app_settings_test: AppSettings) -> str:
 
 @pytest.fixture
 def mock_request() -> MagicMock:
-    request = MagicMock()
-    request.method = "GET"
-    return request
+    return MagicMock(method="GET")
 
 
 @pytest.fixture
@@ -93,7 +103,7 @@ def llm_vendors() -> list[LLMVendor]:
 
 @pytest.fixture
 def mock_db_vendors__all() -> Generator[list[MockVendor], Any, None]:
-    with patch("src.db.repositories.VendorRepository.all") as mock_get_vendors:
+    with patch.object(VendorRepository, "all") as mock_get_vendors:
         mocked_vendors = [
             MockVendor(id=1, slug=VendorSlug.OPENAI, name=VendorSlug.OPENAI),
             MockVendor(id=2, slug=VendorSlug.DEEPSEEK, name=VendorSlug.DEEPSEEK, is_active=False),
@@ -104,7 +114,7 @@ def mock_db_vendors__all() -> Generator[list[MockVendor], Any, None]:
 
 @pytest.fixture
 def mock_db_vendors__active() -> Generator[list[MockVendor], Any, None]:
-    with patch("src.db.repositories.VendorRepository.filter") as mock_get_vendors:
+    with patch.object(VendorRepository, "filter") as mock_get_vendors:
         mocked_vendors = [
             MockVendor(id=1, slug=VendorSlug.OPENAI, name=VendorSlug.OPENAI, is_active=True),
             MockVendor(id=2, slug=VendorSlug.DEEPSEEK, name=VendorSlug.DEEPSEEK, is_active=True),
@@ -114,9 +124,9 @@ def mock_db_vendors__active() -> Generator[list[MockVendor], Any, None]:
 
 
 @pytest.fixture
-def mock_db_api_token__active() -> Generator[MockAPIToken, Any, None]:
-    with patch("src.db.repositories.TokenRepository.get_by_token") as mock_get_by_token:
-        mock_token = MockAPIToken(is_active=True, user=MockUser(id=1, is_active=True))
+def mock_db_api_token__active(mock_user: MockUser) -> Generator[MockAPIToken, Any, None]:
+    with patch.object(TokenRepository, "get_by_token") as mock_get_by_token:
+        mock_token = MockAPIToken(is_active=True, user=mock_user)
         mock_get_by_token.return_value = mock_token
         yield mock_token
 
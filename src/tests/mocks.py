@@ -1,22 +1,49 @@
 import json
+import re
 import dataclasses
 from typing import Any, Self
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock
 
+HEX_PATTERN = re.compile(r"[0-9a-f]*")
 
-@dataclasses.dataclass
+
+@dataclasses.dataclass(frozen=True, slots=True)
 class MockUser:
     id: int
     is_active: bool = False
     username: str = "test-user"
 
 
+@dataclasses.dataclass(frozen=True, slots=True)
+class MockAdminUser(MockUser):
+    is_admin: bool = False
+    email: str = ""
+    verify_password: MagicMock = dataclasses.field(default_factory=MagicMock)
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class MockRequest:
+    """Read-only request stub for code paths which only check the HTTP method"""
+
+    method: str = "GET"
+
+
 @dataclasses.dataclass
 class MockAPIToken:
     is_active: bool
     user: MockUser
 
 
+@dataclasses.dataclass(frozen=True, slots=True)
+class MockTokenState:
+    """Describes what the patched `TokenRepository.get_by_token` should return"""
+
+    token_active: bool = True
+    user_active: bool = True
+    exists: bool = True
+    raises: Exception | None = None
+
+
 @dataclasses.dataclass
 class MockVendor:
     id: int
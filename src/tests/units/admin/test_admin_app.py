@@ -11,6 +11,10 @@ from src.modules.admin.app import AdminApp, ADMIN_VIEWS, make_admin
 from src.modules.admin.views import BaseAPPView, BaseModelView
 from src.services.counters import DashboardCounts
 
+REDIRECT_URL_STR = "http://example.com/redirect"
+REDIRECT_URL_OBJ = URL(REDIRECT_URL_STR)
+REDIRECT_ID = 123
+
 
 @pytest.fixture
 def mock_session_factory() -> MagicMock:
@@ -295,7 +299,7 @@ class TestAdminAppCreate:
     ) -> None:
         mock_request.method = "POST"
         mock_response = MagicMock(spec=Response)
-        mock_response.headers = {"location": "123"}
+        mock_response.headers = {"location": str(REDIRECT_ID)}
         mock_model_view.custom_post_create = True
         mock_model_view.handle_post_create = AsyncMock(return_value=mock_response)
 
@@ -306,7 +310,7 @@ class TestAdminAppCreate:
 
         assert result == mock_response
         mock_create.assert_called_once_with(mock_request)
-        mock_model_view.handle_post_create.assert_called_once_with(mock_request, 123)
+        mock_model_view.handle_post_create.assert_called_once_with(mock_request, REDIRECT_ID)
 
     @pytest.mark.asyncio
     async def test_create_post_request_handle_post_create_error(
@@ -319,7 +323,7 @@ class TestAdminAppCreate:
     ) -> None:
         mock_request.method = "POST"
         mock_response = MagicMock(spec=Response)
-        mock_response.headers = {"location": "123"}
+        mock_response.headers = {"location": str(REDIRECT_ID)}
         mock_model_view.custom_post_create = True
         mock_model_view.handle_post_create = AsyncMock(side_effect=Exception("Handle error"))
 
@@ -342,14 +346,13 @@ class TestAdminAppGetSaveRedirectUrl:
         mock_super_get_save_redirect_url: MagicMock,
     ) -> None:
         mock_model_view.custom_post_create = False
-        mock_redirect_url = "http://example.com/redirect"
-        mock_super_get_save_redirect_url.return_value = mock_redirect_url
+        mock_super_get_save_redirect_url.return_value = REDIRECT_URL_STR
 
         result = admin_app.get_save_redirect_url(
             mock_request, mock_form_data, mock_model_view, mock_base_model
         )
 
-        assert result == mock_redirect_url
+        assert result == REDIRECT_URL_STR
         mock_super_get_save_redirect_url.assert_called_once_with(
             mock_request, mock_form_data, mock_model_view, mock_base_model
         )
@@ -363,12 +366,12 @@ class TestAdminAppGetSaveRedirectUrl:
         mock_base_model: MagicMock,
     ) -> None:
         mock_model_view.custom_post_create = True
-        mock_base_model.id = 123
+        mock_base_model.id = REDIRECT_ID
 
         result = admin_app.get_save_redirect_url(
             mock_request, mock_form_data, mock_model_view, mock_base_model
         )
-        assert result == "123"
+        assert result == str(REDIRECT_ID)
 
     def test_get_save_redirect_url_non_base_model_view(
         self,
@@ -379,14 +382,13 @@ class TestAdminAppGetSaveRedirectUrl:
         mock_super_get_save_redirect_url: MagicMock,
     ) -> None:
         mock_model_view = MagicMock()  # Not a BaseModelView
-        mock_redirect_url = "http://example.com/redirect"
-        mock_super_get_save_redirect_url.return_value = mock_redirect_url
+        mock_super_get_save_redirect_url.return_value = REDIRECT_URL_STR
 
         result = admin_app.get_save_redirect_url(
             mock_request, mock_form_data, mock_model_view, mock_base_model
         )
 
-        assert result == mock_redirect_url
+        assert result == REDIRECT_URL_STR
         mock_super_get_save_redirect_url.assert_called_once_with(
             mock_request, mock_form_data, mock_model_view, mock_base_model
         )
@@ -545,14 +547,13 @@ class TestAdminAppEdgeCases:
         mock_super_get_save_redirect_url: MagicMock,
     ) -> None:
         mock_model_view.custom_post_create = False
-        mock_redirect_url = URL("http://example.com/redirect")
-        mock_super_get_save_redirect_url.return_value = mock_redirect_url
+        mock_super_get_save_redirect_url.return_value = REDIRECT_URL_OBJ
 
         result = admin_app.get_save_redirect_url(
             mock_request, mock_form_data, mock_model_view, mock_base_model
         )
 
-        assert result == mock_redirect_url
+        assert result == REDIRECT_URL_OBJ
         mock_super_get_save_redirect_url.assert_called_once_with(
             mock_request, mock_form_data, mock_model_view, mock_base_model
         )
@@ -1,16 +1,26 @@
-import datetime
-from typing import Any, Generator
-from unittest.mock import AsyncMock, MagicMock, patch
+import contextlib
+import copy
+from datetime import datetime, timedelta
+from typing import Any, AsyncIterator, Callable, Generator
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import pytest
+from _pytest.monkeypatch import MonkeyPatch
 from starlette.datastructures import URL
-from starlette.requests import Request
 from starlette.responses import RedirectResponse
 
+from src.modules.admin.views import tokens as tokens_module
 from src.modules.admin.views.tokens import TokenAdminView
-from src.db.models import Token
 from src.tests.mocks import MockUser
 
+pytestmark = pytest.mark.fast
+
+FIXED_NOW = datetime(2024, 1, 1, 12, 0, 0)
+EXPIRES_AT = FIXED_NOW + timedelta(days=30)
+DETAILS_URL = URL("/admin/tokens/details/1")
+TOKEN_FORM_DATA = {"user": 1, "name": "test-token", "expires_at": EXPIRES_AT}
+
 
 @pytest.fixture
 def token_admin_view(test_app: MagicMock) -> TokenAdminView:
@@ -19,215 +29,205 @@ def token_admin_view(test_app: MagicMock) -> TokenAdminView:
     return view
 
 
-@pytest.fixture
-def mock_request() -> MagicMock:
-    request = MagicMock(spec=Request)
-    request.query_params = {"pks": "1,2,3"}
-    request.url_for = MagicMock()
-    request.url_for.return_value = "/admin/tokens/list"
-    return request
+@pytest.fixture(scope="module")
+def make_request() -> Callable[[dict[str, str]], SimpleNamespace]:
+    def _make(query_params: dict[str, str]) -> SimpleNamespace:
+        return SimpleNamespace(
+            query_params=query_params,
+            url_for=Mock(return_value="/admin/tokens/list"),
+        )
+
+    return _make
 
 
 @pytest.fixture
-def mock_user() -> MockUser:
-    return MockUser(id=1, username="test-user", is_active=True)
+def mock_request(make_request: Callable[[dict[str, str]], SimpleNamespace]) -> SimpleNamespace:
+    return make_request({"pks": "1,2,3"})
 
 
-@pytest.fixture
-def mock_token(mock_user: MockUser) -> MagicMock:
-    token = MagicMock(spec=Token)
-    token.id = 1
-    token.user_id = 1
-    token.user = mock_user
-    token.name = "test-token"
-    token.token = "hashed-token-value"
-    token.is_active = True
-    token.expires_at = datetime.datetime.now() + datetime.timedelta(days=30)
-    token.created_at = datetime.datetime.now()
-    return token
+@pytest.fixture(scope="session")
+def _mock_token_template(mock_user: MockUser) -> SimpleNamespace:
+    return SimpleNamespace(
+        id=1,
+        user_id=1,
+        user=mock_user,
+        name="test-token",
+        token="hashed-token-value",
+        is_active=True,
+        expires_at=EXPIRES_AT,
+        created_at=FIXED_NOW,
+    )
 
 
 @pytest.fixture
-def mock_form_data() -> dict[str, Any]:
-    return {
-        "user": 1,
-        "name": "test-token",
-        "expires_at": datetime.datetime.now() + datetime.timedelta(days=30),
-    }
+def mock_token(_mock_token_template: SimpleNamespace) -> SimpleNamespace:
+    # views write extra attributes (e.g. `raw_token`), so each test gets its own copy
+    return copy.copy(_mock_token_template)
 
 
-@pytest.fixture
-def mock_token_repository() -> Generator[AsyncMock, Any, None]:
-    with patch("src.modules.admin.views.tokens.TokenRepository") as mock_repo_class:
-        mock_repo = AsyncMock()
-        mock_repo_class.return_value = mock_repo
-        yield mock_repo
+@pytest.fixture(scope="module")
+def mock_token_info() -> Mock:
+    token_info = Mock()
+    token_info.hashed_value = "hashed-token-value"
+    token_info.value = "raw-token-value"
+    return token_info
 
 
-@pytest.fixture
-def mock_uow() -> Generator[AsyncMock, Any, None]:
-    with patch("src.modules.admin.views.tokens.SASessionUOW") as mock_uow_class:
-        mock_uow = AsyncMock()
-        mock_uow_class.return_value.__aenter__.return_value = mock_uow
-        mock_uow_class.return_value.__aexit__.return_value = None
+@pytest.fixture(autouse=True, scope="module")
+def _patched_tokens_module(mock_token_info: Mock) -> Generator[SimpleNamespace, Any, None]:
+    mock_repo = AsyncMock()
+    mock_uow = AsyncMock()
+    mock_cache = Mock()
+    mock_make_api_token = Mock(return_value=mock_token_info)
+
+    @contextlib.asynccontextmanager
+    async def mock_uow_class() -> AsyncIterator[AsyncMock]:
         yield mock_uow
 
+    with MonkeyPatch.context() as mp:
+        mp.setattr(tokens_module, "TokenRepository", lambda session: mock_repo)
+        mp.setattr(tokens_module, "SASessionUOW", mock_uow_class)
+        mp.setattr(tokens_module, "InMemoryCache", lambda: mock_cache)
+        mp.setattr(tokens_module, "make_api_token", mock_make_api_token)
+        yield SimpleNamespace(
+            token_repository=mock_repo,
+            uow=mock_uow,
+            cache=mock_cache,
+            make_api_token=mock_make_api_token,
+        )
 
-@pytest.fixture
-def mock_cache() -> Generator[MagicMock, Any, None]:
-    with patch("src.modules.admin.views.tokens.InMemoryCache") as mock_cache_class:
-        mock_cache = MagicMock()
-        mock_cache_class.return_value = mock_cache
-        yield mock_cache
+
+@pytest.fixture(autouse=True)
+def _reset_patched_tokens_module(
+    _patched_tokens_module: SimpleNamespace,
+) -> Generator[None, Any, None]:
+    yield
+    _patched_tokens_module.token_repository.reset_mock(return_value=True, side_effect=True)
+    _patched_tokens_module.uow.reset_mock(return_value=True, side_effect=True)
+    _patched_tokens_module.cache.reset_mock(return_value=True, side_effect=True)
+    _patched_tokens_module.make_api_token.reset_mock()
 
 
 @pytest.fixture
-def mock_make_api_token() -> Generator[MagicMock, Any, None]:
-    with patch("src.modules.admin.views.tokens.make_api_token") as mock_make_token:
-        mock_token_info = MagicMock()
-        mock_token_info.hashed_value = "hashed-token-value"
-        mock_token_info.value = "raw-token-value"
-        mock_make_token.return_value = mock_token_info
-        yield mock_make_token
+def mock_token_repository(_patched_tokens_module: SimpleNamespace) -> AsyncMock:
+    return _patched_tokens_module.token_repository
 
 
-class TestTokenAdminViewInsertModel:
+@pytest.fixture
+def mock_uow(_patched_tokens_module: SimpleNamespace) -> AsyncMock:
+    return _patched_tokens_module.uow
 
-    @pytest.mark.asyncio
-    async def test_insert_model_success(
-        self,
-        token_admin_view: TokenAdminView,
-        mock_request: MagicMock,
-        mock_form_data: dict[str, Any],
-        mock_token: Token,
-        mock_cache: MagicMock,
-        mock_make_api_token: MagicMock,
-        mock_super_model_view_insert: MagicMock,
-    ) -> None:
-        mock_super_model_view_insert.return_value = mock_token
-        result = await token_admin_view.insert_model(mock_request, mock_form_data)
 
-        assert result == mock_token
-        mock_super_model_view_insert.assert_called_once()
-        mock_cache.set.assert_called_once_with(f"token__{mock_token.id}", "raw-token-value", ttl=10)
+@pytest.fixture
+def mock_cache(_patched_tokens_module: SimpleNamespace) -> Mock:
+    return _patched_tokens_module.cache
 
-    @pytest.mark.asyncio
-    async def test_insert_model_without_expiration(
-        self,
-        token_admin_view: TokenAdminView,
-        mock_request: MagicMock,
-        mock_token: Token,
-        mock_cache: MagicMock,
-        mock_make_api_token: MagicMock,
-        mock_super_model_view_insert: MagicMock,
-    ) -> None:
-        mock_super_model_view_insert.return_value = mock_token
 
-        result = await token_admin_view.insert_model(
-            mock_request,
-            data={"user": 1, "name": "test-token"},
-        )
+@pytest.fixture
+def mock_make_api_token(_patched_tokens_module: SimpleNamespace) -> Mock:
+    return _patched_tokens_module.make_api_token
 
-        assert result == mock_token
-        mock_make_api_token.assert_called_once_with(
-            expires_at=None, settings=token_admin_view.app.settings
-        )
 
-    @pytest.mark.asyncio
-    async def test_insert_model_with_expiration(
+class TestTokenAdminViewInsertModel:
+
+    @pytest.mark.parametrize(
+        "form_data",
+        [
+            {"user": 1, "name": "test-token"},
+            {"user": 1, "name": "test-token", "expires_at": None},
+            TOKEN_FORM_DATA,
+        ],
+        ids=["without-expiration", "empty-expiration", "with-expiration"],
+    )
+    async def test_insert_model(
         self,
         token_admin_view: TokenAdminView,
-        mock_request: MagicMock,
-        mock_token: Token,
-        mock_cache: MagicMock,
-        mock_make_api_token: MagicMock,
+        mock_request: SimpleNamespace,
+        form_data: dict[str, Any],
+        mock_token: SimpleNamespace,
+        mock_cache: Mock,
+        mock_make_api_token: Mock,
+        mock_token_info: Mock,
         mock_super_model_view_insert: MagicMock,
     ) -> None:
         mock_super_model_view_insert.return_value = mock_token
-        expires_at = datetime.datetime.now() + datetime.timedelta(days=30)
 
-        result = await token_admin_view.insert_model(
-            mock_request,
-            data={"user": 1, "name": "test-token", "expires_at": expires_at},
-        )
+        result = await token_admin_view.insert_model(mock_request, data=dict(form_data))
 
         assert result == mock_token
+        mock_super_model_view_insert.assert_called_once()
         mock_make_api_token.assert_called_once_with(
-            expires_at=expires_at, settings=token_admin_view.app.settings
+            expires_at=form_data.get("expires_at"), settings=token_admin_view.app.settings
+        )
+        mock_cache.set.assert_called_once_with(
+            f"token__{mock_token.id}", mock_token_info.value, ttl=10
         )
 
 
 class TestTokenAdminViewOperations:
 
-    @pytest.mark.asyncio
-    async def test_get_object_for_details_success(
+    @pytest.mark.parametrize(
+        "cached_value, expected_raw_token",
+        [
+            ("raw-token-value", "raw-token-value"),
+            (None, "None"),
+        ],
+        ids=["cached", "no-cache"],
+    )
+    async def test_get_object_for_details(
         self,
         token_admin_view: TokenAdminView,
-        mock_request: MagicMock,
-        mock_token: Token,
-        mock_cache: MagicMock,
+        mock_request: SimpleNamespace,
+        mock_token: SimpleNamespace,
+        mock_cache: Mock,
         mock_super_model_view_get_details: MagicMock,
+        cached_value: str | None,
+        expected_raw_token: str,
     ) -> None:
-        # Setup mocks
         mock_super_model_view_get_details.return_value = mock_token
-        mock_cache.get.return_value = "raw-token-value"
+        mock_cache.get.return_value = cached_value
 
         result = await token_admin_view.get_object_for_details(mock_request)
 
         assert result == mock_token
-        assert result.raw_token == "raw-token-value"
-        mock_cache.get.assert_called_once_with(f"token__{mock_token.id}")
-        mock_cache.invalidate.assert_called_once_with(f"token__{mock_token.id}")
-
-    @pytest.mark.asyncio
-    async def test_get_object_for_details_no_cache(
-        self,
-        token_admin_view: TokenAdminView,
-        mock_request: MagicMock,
-        mock_token: Token,
-        mock_cache: MagicMock,
-        mock_super_model_view_get_details: MagicMock,
-    ) -> None:
-        mock_super_model_view_get_details.return_value = mock_token
-        mock_cache.get.return_value = None
-
-        result = await token_admin_view.get_object_for_details(mock_request)
-
-        assert result == mock_token
-        assert result.raw_token == "None"
+        assert result.raw_token == expected_raw_token
         mock_cache.get.assert_called_once_with(f"token__{mock_token.id}")
         mock_cache.invalidate.assert_called_once_with(f"token__{mock_token.id}")
 
     def test_get_save_redirect_url(
         self,
         token_admin_view: TokenAdminView,
-        mock_request: MagicMock,
-        mock_token: Token,
+        mock_request: SimpleNamespace,
+        mock_token: SimpleNamespace,
         mock_super_model_url_build_for: MagicMock,
     ) -> None:
-        mock_super_model_url_build_for.return_value = URL("/admin/tokens/details/1")
+        mock_super_model_url_build_for.return_value = DETAILS_URL
 
         result = token_admin_view.get_save_redirect_url(mock_request, mock_token)
 
         # Verify
-        assert result == URL("/admin/tokens/details/1")
+        assert result == DETAILS_URL
         mock_super_model_url_build_for.assert_called_once_with(
             "admin:details", request=mock_request, obj=mock_token
         )
 
 
-@pytest.mark.asyncio
 class TestTokenAdminViewActions:
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def mock_set_active(self) -> Generator[MagicMock, Any, None]:
         with patch("src.modules.admin.views.tokens.TokenAdminView._set_active") as mock_set_active:
             yield mock_set_active
 
+    @pytest.fixture(autouse=True)
+    def _reset_mock_set_active(self, mock_set_active: MagicMock) -> Generator[None, Any, None]:
+        yield
+        mock_set_active.reset_mock(return_value=True)
+
     async def test_deactivate_tokens_success(
         self,
         token_admin_view: TokenAdminView,
-        mock_request: MagicMock,
+        mock_request: SimpleNamespace,
         mock_set_active: MagicMock,
     ) -> None:
         mock_set_active.return_value = RedirectResponse("/admin/tokens/list")
@@ -239,7 +239,7 @@ class TestTokenAdminViewActions:
     async def test_activate_tokens_success(
         self,
         token_admin_view: TokenAdminView,
-        mock_request: MagicMock,
+        mock_request: SimpleNamespace,
         mock_set_active: MagicMock,
     ) -> None:
         mock_set_active.return_value = RedirectResponse("/admin/tokens/list")
@@ -252,130 +252,82 @@ class TestTokenAdminViewActions:
 
 class TestTokenAdminViewSetActive:
 
-    @pytest.mark.asyncio
-    async def test_set_active_success(
-        self,
-        token_admin_view: TokenAdminView,
-        mock_request: MagicMock,
-        mock_token_repository: AsyncMock,
-        mock_uow: AsyncMock,
-    ) -> None:
-        # Setup mocks
-        mock_uow.session = MagicMock()
-        mock_token_repository.set_active.return_value = None
-
-        # Execute
-        result = await token_admin_view._set_active(mock_request, is_active=True)
-
-        # Verify
-        assert isinstance(result, RedirectResponse)
-        mock_token_repository.set_active.assert_called_once_with([1, 2, 3], is_active=True)
-        mock_uow.commit.assert_called_once()
-
-    @pytest.mark.asyncio
-    async def test_set_active_no_pks(
+    @pytest.mark.parametrize(
+        "query_params, is_active, expected_ids",
+        [
+            ({"pks": "1,2,3"}, True, [1, 2, 3]),
+            ({"pks": "1,2,3"}, False, [1, 2, 3]),
+            ({"pks": ""}, True, None),
+            ({}, True, None),
+        ],
+        ids=["activate", "deactivate", "no-pks", "empty-pks"],
+    )
+    async def test_set_active(
         self,
         token_admin_view: TokenAdminView,
-        mock_request: MagicMock,
+        make_request: Callable[[dict[str, str]], SimpleNamespace],
         mock_token_repository: AsyncMock,
         mock_uow: AsyncMock,
+        query_params: dict[str, str],
+        is_active: bool,
+        expected_ids: list[int] | None,
     ) -> None:
-        # Setup mocks
-        mock_request.query_params = {"pks": ""}
-        mock_uow.session = MagicMock()
-        mock_token_repository.set_active.return_value = None
-
-        with pytest.raises(ValueError, match="No pks provided"):
-            await token_admin_view._set_active(mock_request, is_active=True)
+        mock_request = make_request(query_params)
 
-        mock_token_repository.set_active.assert_not_called()
-
-    @pytest.mark.asyncio
-    async def test_set_active_empty_pks(
-        self,
-        token_admin_view: TokenAdminView,
-        mock_request: MagicMock,
-        mock_token_repository: AsyncMock,
-        mock_uow: AsyncMock,
-    ) -> None:
-        # Setup mocks
-        mock_request.query_params = {}
-        mock_uow.session = MagicMock()
-        mock_token_repository.set_active.return_value = None
+        if expected_ids is None:
+            with pytest.raises(ValueError, match="No pks provided"):
+                await token_admin_view._set_active(mock_request, is_active=is_active)
 
-        with pytest.raises(ValueError, match="No pks provided"):
-            await token_admin_view._set_active(mock_request, is_active=True)
+            mock_token_repository.set_active.assert_not_called()
+            mock_uow.commit.assert_not_called()
+            return
 
-        mock_token_repository.set_active.assert_not_called()
+        result = await token_admin_view._set_active(mock_request, is_active=is_active)
 
-    @pytest.mark.asyncio
-    async def test_set_active_deactivate(
-        self,
-        token_admin_view: TokenAdminView,
-        mock_request: MagicMock,
-        mock_token_repository: AsyncMock,
-        mock_uow: AsyncMock,
-    ) -> None:
-        # Setup mocks
-        mock_uow.session = MagicMock()
-        mock_token_repository.set_active.return_value = None
-
-        # Execute
-        result = await token_admin_view._set_active(mock_request, is_active=False)
-
-        # Verify
         assert isinstance(result, RedirectResponse)
-        mock_token_repository.set_active.assert_called_once_with([1, 2, 3], is_active=False)
+        mock_token_repository.set_active.assert_called_once_with(expected_ids, is_active=is_active)
         mock_uow.commit.assert_called_once()
 
 
 class TestTokenAdminViewEdgeCases:
 
-    @pytest.mark.asyncio
-    async def test_insert_model_database_error(
+    @pytest.fixture
+    def failing_database(
         self,
-        token_admin_view: TokenAdminView,
-        mock_request: MagicMock,
-        mock_form_data: dict[str, Any],
         mock_super_model_view_insert: MagicMock,
-    ) -> None:
-        mock_super_model_view_insert.side_effect = Exception("Database error")
-
-        with pytest.raises(Exception, match="Database error"):
-            await token_admin_view.insert_model(mock_request, mock_form_data)
-
-    @pytest.mark.asyncio
-    async def test_get_object_for_details_database_error(
-        self,
-        token_admin_view: TokenAdminView,
-        mock_request: MagicMock,
-        mock_cache: MagicMock,
         mock_super_model_view_get_details: MagicMock,
+        mock_token_repository: AsyncMock,
     ) -> None:
+        mock_super_model_view_insert.side_effect = Exception("Database error")
         mock_super_model_view_get_details.side_effect = Exception("Database error")
+        mock_token_repository.set_active.side_effect = Exception("Database error")
 
-        with pytest.raises(Exception, match="Database error"):
-            await token_admin_view.get_object_for_details(mock_request)
-
-    @pytest.mark.asyncio
-    async def test_set_active_database_error(
+    @pytest.mark.parametrize(
+        "method_name, call_kwargs",
+        [
+            ("insert_model", {"data": {"user": 1, "name": "test-token"}}),
+            ("get_object_for_details", {}),
+            ("_set_active", {"is_active": True}),
+        ],
+        ids=["insert-model", "get-object-for-details", "set-active"],
+    )
+    @pytest.mark.usefixtures("failing_database")
+    async def test_method_database_error(
         self,
         token_admin_view: TokenAdminView,
-        mock_request: MagicMock,
-        mock_token_repository: AsyncMock,
-        mock_uow: AsyncMock,
+        mock_request: SimpleNamespace,
+        method_name: str,
+        call_kwargs: dict[str, Any],
     ) -> None:
-        mock_uow.session = MagicMock()
-        mock_token_repository.set_active.side_effect = Exception("Database error")
-
+        method = getattr(token_admin_view, method_name)
         with pytest.raises(Exception, match="Database error"):
-            await token_admin_view._set_active(mock_request, is_active=True)
+            await method(mock_request, **call_kwargs)
 
     def test_get_save_redirect_url_error(
         self,
         token_admin_view: TokenAdminView,
-        mock_request: MagicMock,
-        mock_token: Token,
+        mock_request: SimpleNamespace,
+        mock_token: SimpleNamespace,
         mock_super_model_url_build_for: MagicMock,
     ) -> None:
         mock_super_model_url_build_for.side_effect = Exception("URL build error")
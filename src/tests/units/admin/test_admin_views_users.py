@@ -1,7 +1,9 @@
+from types import SimpleNamespace
 from typing import Any, Generator
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import DEFAULT, AsyncMock, MagicMock, patch
 
 import pytest
+from _pytest.monkeypatch import MonkeyPatch
 from fastapi import HTTPException
 
 from src.db.models import User
@@ -10,20 +12,54 @@ from src.modules.admin.views.base import FormDataType
 from src.tests.mocks import MockUser
 from src.modules.admin.views.users import UserAdminView, UserAdminForm
 
+pytestmark = pytest.mark.fast
+
+
+@pytest.fixture(autouse=True, scope="module")
+def _patched_make_password() -> Generator[MagicMock, Any, None]:
+    with MonkeyPatch.context() as monkeypatch:
+        make_password = MagicMock(return_value="hashed-password")
+        monkeypatch.setattr(User, "make_password", make_password)
+        yield make_password
+
+
+@pytest.fixture
+def mock_user_make_password(_patched_make_password: MagicMock) -> MagicMock:
+    _patched_make_password.reset_mock()
+    return _patched_make_password
+
 
 @pytest.fixture
-def mock_user_make_password() -> Generator[MagicMock, Any, None]:
-    with patch.object(User, "make_password", return_value="hashed-password") as mock_make_password:
-        yield mock_make_password
+def admin_patches() -> Generator[SimpleNamespace, Any, None]:
+    """Patches users view's repository and UOW in one pass"""
+    with patch.multiple(
+        "src.modules.admin.views.users",
+        UserRepository=DEFAULT,
+        SASessionUOW=DEFAULT,
+    ) as mocks:
+        # only `get_by_username` is awaited, `uow` just provides `.session`
+        user_repo = MagicMock(get_by_username=AsyncMock(return_value=None))
+        uow = MagicMock()
+        mocks["UserRepository"].return_value = user_repo
+        mocks["SASessionUOW"].return_value.__aenter__.return_value = uow
+        mocks["SASessionUOW"].return_value.__aexit__.return_value = None
+        yield SimpleNamespace(user_repo=user_repo, uow=uow)
 
 
 @pytest.fixture
-def mock_uow() -> Generator[AsyncMock, Any, None]:
-    with patch("src.modules.admin.views.users.SASessionUOW") as mock_uow_class:
-        mock_uow = AsyncMock()
-        mock_uow_class.return_value.__aenter__.return_value = mock_uow
-        mock_uow_class.return_value.__aexit__.return_value = None
-        yield mock_uow
+def mock_uow(admin_patches: SimpleNamespace) -> MagicMock:
+    return admin_patches.uow
+
+
+@pytest.fixture
+def mock_user_repository(admin_patches: SimpleNamespace) -> MagicMock:
+    return admin_patches.user_repo
+
+
+@pytest.fixture(scope="module")
+def pristine_user_form() -> UserAdminForm:
+    """Shared unprocessed form: only for tests that don't call `process`/`validate`"""
+    return UserAdminForm()
 
 
 @pytest.fixture
@@ -33,18 +69,10 @@ def user_admin_view(test_app: CodeAgentAPP) -> UserAdminView:
     return view
 
 
-@pytest.fixture
-def mock_user_repository() -> Generator[AsyncMock, Any, None]:
-    with patch("src.modules.admin.views.users.UserRepository") as mock_repo_class:
-        mock_repo = AsyncMock()
-        mock_repo_class.return_value = mock_repo
-        yield mock_repo
-
-
 class TestUserAdminForm:
 
-    def test_form_creation(self) -> None:
-        form = UserAdminForm()
+    def test_form_creation(self, pristine_user_form: UserAdminForm) -> None:
+        form = pristine_user_form
 
         # Verify all fields exist
         assert hasattr(form, "username")
@@ -116,14 +144,13 @@ class TestUserAdminForm:
 
 class TestUserAdminViewInsertModel:
 
-    @pytest.mark.asyncio
     async def test_insert_model_success(
         self,
         user_admin_view: UserAdminView,
         mock_request: MagicMock,
         mock_user: MockUser,
-        mock_user_repository: AsyncMock,
-        mock_uow: AsyncMock,
+        mock_user_repository: MagicMock,
+        mock_uow: MagicMock,
         mock_user_make_password: MagicMock,
         mock_super_model_view_insert: MagicMock,
     ) -> None:
@@ -141,67 +168,59 @@ class TestUserAdminViewInsertModel:
 
         assert result == mock_user
         mock_super_model_view_insert.assert_called_once_with(mock_request, user_data)
-        # Check that password was hashed
-        # call_args = mock_super_insert.call_args[0]
-        # assert call_args[1]["password"] == "hashed-password"
-        # assert "new_password" not in call_args[1]
-
-    @pytest.mark.asyncio
-    async def test_insert_model_no_password(
-        self,
-        user_admin_view: UserAdminView,
-        mock_request: MagicMock,
-        mock_user_repository: AsyncMock,
-        mock_uow: AsyncMock,
-    ) -> None:
-
-        with pytest.raises(HTTPException) as exc_info:
-            await user_admin_view.insert_model(
-                mock_request,
-                data={
-                    "username": "new-user",
-                    "email": "new-user@example.com",
-                    "is_admin": False,
-                    "is_active": True,
-                },
-            )
-
-        assert exc_info.value.status_code == 400
-        assert exc_info.value.detail == "Password required"
-
-    @pytest.mark.asyncio
-    async def test_insert_model_username_taken(
+        # Check that password was hashed (insert_model updates passed data in place)
+        assert user_data["password"] == "hashed-password"
+        assert "new_password" not in user_data
+
+    @pytest.mark.parametrize(
+        "form_data, username_exists, expected_detail",
+        [
+            pytest.param({}, False, "Password required", id="no-password"),
+            pytest.param({"new_password": ""}, False, "Password required", id="empty-password"),
+            pytest.param({"new_password": None}, False, "Password required", id="none-password"),
+            pytest.param(
+                {"username": "existing-user", "new_password": "password123"},
+                True,
+                "Username already taken",
+                id="username-taken",
+            ),
+        ],
+    )
+    async def test_insert_model_rejects(
         self,
         user_admin_view: UserAdminView,
         mock_request: MagicMock,
         mock_user: MockUser,
-        mock_user_repository: AsyncMock,
-        mock_uow: AsyncMock,
+        mock_user_repository: MagicMock,
+        mock_uow: MagicMock,
+        form_data: FormDataType,
+        username_exists: bool,
+        expected_detail: str,
     ) -> None:
-        mock_user_repository.get_by_username.return_value = mock_user
+        if username_exists:
+            mock_user_repository.get_by_username.return_value = mock_user
 
         with pytest.raises(HTTPException) as exc_info:
             await user_admin_view.insert_model(
                 mock_request,
                 data={
-                    "username": "existing-user",
+                    "username": "new-user",
                     "email": "new-user@example.com",
-                    "new_password": "password123",
                     "is_admin": False,
                     "is_active": True,
-                },
+                }
+                | form_data,
             )
 
         assert exc_info.value.status_code == 400
-        assert exc_info.value.detail == "Username already taken"
+        assert exc_info.value.detail == expected_detail
 
-    @pytest.mark.asyncio
     async def test_insert_model_database_error(
         self,
         user_admin_view: UserAdminView,
         mock_request: MagicMock,
-        mock_user_repository: AsyncMock,
-        mock_uow: AsyncMock,
+        mock_user_repository: MagicMock,
+        mock_uow: MagicMock,
     ) -> None:
 
         mock_user_repository.get_by_username.side_effect = Exception("Database error")
@@ -222,7 +241,6 @@ class TestUserAdminViewInsertModel:
 
 class TestUserAdminViewUpdateModel:
 
-    @pytest.mark.asyncio
     async def test_update_model_success_with_password(
         self,
         user_admin_view: UserAdminView,
@@ -259,7 +277,6 @@ class TestUserAdminViewUpdateModel:
         assert "new_password" not in call_args[2]
         assert "repeat_password" not in call_args[2]
 
-    @pytest.mark.asyncio
     async def test_update_model_success_without_password(
         self,
         user_admin_view: UserAdminView,
@@ -285,7 +302,6 @@ class TestUserAdminViewUpdateModel:
             mock_request, str(mock_user.id), update_user_data
         )
 
-    @pytest.mark.asyncio
     async def test_update_model_database_error(
         self,
         user_admin_view: UserAdminView,
@@ -308,11 +324,10 @@ class TestUserAdminViewUpdateModel:
 
 class TestUserAdminViewValidateUsername:
 
-    @pytest.mark.asyncio
     async def test_validate_username_success(
         self,
-        mock_user_repository: AsyncMock,
-        mock_uow: AsyncMock,
+        mock_user_repository: MagicMock,
+        mock_uow: MagicMock,
     ) -> None:
         # Setup mocks
         mock_user_repository.get_by_username.return_value = None
@@ -323,12 +338,11 @@ class TestUserAdminViewValidateUsername:
         # Verify
         mock_user_repository.get_by_username.assert_called_once_with("new-username")
 
-    @pytest.mark.asyncio
     async def test_validate_username_taken(
         self,
         mock_user: MockUser,
-        mock_user_repository: AsyncMock,
-        mock_uow: AsyncMock,
+        mock_user_repository: MagicMock,
+        mock_uow: MagicMock,
     ) -> None:
         # Setup mocks
         mock_user_repository.get_by_username.return_value = mock_user
@@ -341,11 +355,10 @@ class TestUserAdminViewValidateUsername:
         assert exc_info.value.status_code == 400
         assert exc_info.value.detail == "Username already taken"
 
-    @pytest.mark.asyncio
     async def test_validate_username_database_error(
         self,
-        mock_user_repository: AsyncMock,
-        mock_uow: AsyncMock,
+        mock_user_repository: MagicMock,
+        mock_uow: MagicMock,
     ) -> None:
         # Setup mocks
         mock_user_repository.get_by_username.side_effect = Exception("Database error")
@@ -357,8 +370,8 @@ class TestUserAdminViewValidateUsername:
 
 class TestUserAdminViewEdgeCases:
 
-    def test_form_field_attributes(self) -> None:
-        form = UserAdminForm()
+    def test_form_field_attributes(self, pristine_user_form: UserAdminForm) -> None:
+        form = pristine_user_form
 
         # Test username field
         assert form.username.label.text == "Username"
@@ -376,55 +389,6 @@ class TestUserAdminViewEdgeCases:
         assert form.is_admin.label.text == "Is Admin"
         assert form.is_active.label.text == "Is Active"
 
-    @pytest.mark.asyncio
-    async def test_insert_model_empty_password(
-        self,
-        user_admin_view: UserAdminView,
-        mock_request: MagicMock,
-        mock_user_repository: AsyncMock,
-        mock_uow: AsyncMock,
-    ) -> None:
-
-        with pytest.raises(HTTPException) as exc_info:
-            await user_admin_view.insert_model(
-                mock_request,
-                data={
-                    "username": "new-user",
-                    "email": "new-user@example.com",
-                    "new_password": "",
-                    "is_admin": False,
-                    "is_active": True,
-                },
-            )
-
-        # Verify
-        assert exc_info.value.status_code == 400
-        assert exc_info.value.detail == "Password required"
-
-    @pytest.mark.asyncio
-    async def test_insert_model_none_password(
-        self,
-        user_admin_view: UserAdminView,
-        mock_request: MagicMock,
-        mock_user_repository: AsyncMock,
-        mock_uow: AsyncMock,
-    ) -> None:
-
-        with pytest.raises(HTTPException) as exc_info:
-            await user_admin_view.insert_model(
-                mock_request,
-                data={
-                    "username": "new-user",
-                    "email": "new-user@example.com",
-                    "new_password": None,
-                    "is_admin": False,
-                    "is_active": True,
-                },
-            )
-
-        assert exc_info.value.status_code == 400
-        assert exc_info.value.detail == "Password required"
-
     def test_form_validation_with_none_values(self) -> None:
         form = UserAdminForm()
         form.process(
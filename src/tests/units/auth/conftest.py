@@ -1,79 +1,72 @@
-from typing import Any, Generator
-from unittest.mock import MagicMock, patch, AsyncMock
+import contextlib
+from types import SimpleNamespace
+from typing import Any, Callable, Generator
+from unittest.mock import patch, AsyncMock
 
 import pytest
+from _pytest.monkeypatch import MonkeyPatch
 from starlette.exceptions import HTTPException
 
-from src.tests.mocks import MockAPIToken, MockUser
+from src.db.repositories import TokenRepository
+from src.modules.auth import tokens
+from src.tests.mocks import MockAPIToken, MockRequest, MockTokenState, MockUser
 
-
-@pytest.fixture
-def mock_make_token() -> Generator[MagicMock, Any, None]:
-    with patch("src.modules.auth.tokens.make_api_token") as mock:
-        mock.return_value = MagicMock(value="test-token-value", hashed_value="test-hash")
-        yield mock
+DECODED_TOKEN_SUBS: dict[str, str | None] = {"ok": "test-user-id", "empty": "", "none": None}
+INVALID_TOKEN_ERROR = HTTPException(status_code=401, detail="Invalid token")
 
 
-@pytest.fixture
-def mock_decode_token() -> Generator[MagicMock, Any, None]:
-    with patch("src.modules.auth.tokens.decode_api_token") as mock:
-        mock.return_value = MagicMock(sub="test-user-id")
-        yield mock
+@pytest.fixture(scope="module")
+def mock_request() -> MockRequest:
+    return MockRequest(method="GET")
 
 
-@pytest.fixture
-def mock_hash_token() -> Generator[MagicMock, Any, None]:
-    with patch("src.modules.auth.tokens.hash_token") as mock:
-        mock.return_value = "test-hash"
-        yield mock
+@pytest.fixture(scope="module")
+def options_request() -> MockRequest:
+    return MockRequest(method="OPTIONS")
 
 
 @pytest.fixture
-def mock_db_api_token__inactive() -> Generator[MockAPIToken, Any, None]:
-    with patch("src.db.repositories.TokenRepository.get_by_token") as mock_get_by_token:
-        mock_token = MockAPIToken(is_active=False, user=MockUser(id=1, is_active=True))
-        mock_get_by_token.return_value = mock_token
-        yield mock_token
+def mock_decode_token(
+    request: pytest.FixtureRequest, monkeypatch: MonkeyPatch
+) -> Callable[..., SimpleNamespace]:
+    """Patches `decode_api_token` according to (indirect) param: DECODED_TOKEN_SUBS key or `error`"""
+    mode: str = getattr(request, "param", "ok")
 
+    def decode_api_token(*_: Any, **__: Any) -> SimpleNamespace:
+        if mode == "error":
+            raise INVALID_TOKEN_ERROR
 
-@pytest.fixture
-def mock_db_api_token__user_inactive() -> Generator[MockAPIToken, Any, None]:
-    with patch("src.db.repositories.TokenRepository.get_by_token") as mock_get_by_token:
-        mock_token = MockAPIToken(is_active=True, user=MockUser(id=1, is_active=False))
-        mock_get_by_token.return_value = mock_token
-        yield mock_token
-
+        return SimpleNamespace(sub=DECODED_TOKEN_SUBS[mode])
 
-@pytest.fixture
-def mock_db_api_token__unknown() -> Generator[AsyncMock, Any, None]:
-    with patch("src.db.repositories.TokenRepository.get_by_token") as mock_get_by_token:
-        mock_get_by_token.return_value = None
-        yield mock_get_by_token
+    monkeypatch.setattr(tokens, "decode_api_token", decode_api_token)
+    return decode_api_token
 
 
 @pytest.fixture
-def mock_db_api_token__repository_error() -> Generator[AsyncMock, Any, None]:
-    with patch("src.db.repositories.TokenRepository.get_by_token") as mock_get_by_token:
-        mock_get_by_token.side_effect = RuntimeError("Database error")
-        yield mock_get_by_token
-
-
-@pytest.fixture
-def mock_decode_token__no_identity() -> Generator[MagicMock, Any, None]:
-    with patch("src.modules.auth.tokens.decode_api_token") as mock:
-        mock.return_value = MagicMock(sub="")
-        yield mock
+def auth_pipeline() -> Generator[SimpleNamespace, Any, None]:
+    """Patches decoding, hashing and DB unit of work used by `verify_api_token` in one pass"""
+    with contextlib.ExitStack() as stack:
+        decode = stack.enter_context(patch.object(tokens, "decode_api_token"))
+        hash_token = stack.enter_context(patch.object(tokens, "hash_token"))
+        uow = stack.enter_context(patch.object(tokens, "SASessionUOW"))
+        decode.return_value = SimpleNamespace(sub=DECODED_TOKEN_SUBS["ok"])
+        hash_token.return_value = "test-hash"
+        yield SimpleNamespace(decode=decode, hash_token=hash_token, uow=uow)
 
 
 @pytest.fixture
-def mock_decode_token__none_identity() -> Generator[MagicMock, Any, None]:
-    with patch("src.modules.auth.tokens.decode_api_token") as mock:
-        mock.return_value = MagicMock(sub=None)
-        yield mock
+def token_repo(request: pytest.FixtureRequest) -> Generator[AsyncMock, Any, None]:
+    """Patches `TokenRepository.get_by_token` according to (indirect) MockTokenState param"""
+    state: MockTokenState = getattr(request, "param", MockTokenState())
+    with patch.object(TokenRepository, "get_by_token") as mock_get_by_token:
+        if state.raises is not None:
+            mock_get_by_token.side_effect = state.raises
+        elif state.exists:
+            mock_get_by_token.return_value = MockAPIToken(
+                is_active=state.token_active,
+                user=MockUser(id=1, is_active=state.user_active),
+            )
+        else:
+            mock_get_by_token.return_value = None
 
-
-@pytest.fixture
-def mock_decode_token__error() -> Generator[MagicMock, Any, None]:
-    with patch("src.modules.auth.tokens.decode_api_token") as mock:
-        mock.side_effect = HTTPException(status_code=401, detail="Invalid token")
-        yield mock
+        yield mock_get_by_token
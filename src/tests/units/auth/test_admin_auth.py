@@ -1,13 +1,13 @@
 import datetime
+from types import SimpleNamespace
 from typing import Any, Generator
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from jwt import PyJWTError
-from fastapi import Request
 
 from src.settings import AppSettings
-from src.tests.mocks import MockUser
+from src.tests.mocks import MockAdminUser
 from src.modules.admin.auth import AdminAuth, UserPayload
 
 
@@ -29,50 +29,45 @@ class TestAdminAuth:
         return AdminAuth(secret_key="test-secret-key", settings=app_settings)
 
     @pytest.fixture
-    def mock_user_admin(self) -> MockUser:
+    def mock_user_admin(self) -> MockAdminUser:
         """Create mock admin user."""
-        user = MockUser(
+        return MockAdminUser(
             id=1,
             username="admin",
             is_active=True,
+            is_admin=True,
+            email="admin@test.com",
+            verify_password=MagicMock(return_value=True),
         )
-        user.is_admin = True
-        user.email = "admin@test.com"
-        user.verify_password = MagicMock(return_value=True)
-        return user
 
     @pytest.fixture
-    def mock_user_regular(self) -> MockUser:
+    def mock_user_regular(self) -> MockAdminUser:
         """Create mock regular user."""
-        user = MockUser(
+        return MockAdminUser(
             id=2,
             username="user",
             is_active=True,
+            is_admin=False,
+            email="user@test.com",
+            verify_password=MagicMock(return_value=True),
         )
-        user.is_admin = False
-        user.email = "user@test.com"
-        user.verify_password = MagicMock(return_value=True)
-        return user
 
     @pytest.fixture
-    def mock_user_inactive(self) -> MockUser:
+    def mock_user_inactive(self) -> MockAdminUser:
         """Create mock inactive user."""
-        user = MockUser(
+        return MockAdminUser(
             id=3,
             username="inactive",
             is_active=False,
+            is_admin=True,
+            email="inactive@test.com",
+            verify_password=MagicMock(return_value=True),
         )
-        user.is_admin = True
-        user.email = "inactive@test.com"
-        user.verify_password = MagicMock(return_value=True)
-        return user
 
     @pytest.fixture
-    def mock_request(self) -> MagicMock:
-        """Create mock FastAPI request."""
-        request = MagicMock(spec=Request)
-        request.session = {}
-        return request
+    def mock_request(self) -> SimpleNamespace:
+        """Create mock FastAPI request (AdminAuth only touches `form` and `session`)."""
+        return SimpleNamespace(session={})
 
     @pytest.fixture
     def mock_form_data(self) -> dict[str, str]:
@@ -113,15 +108,14 @@ class TestAdminAuth:
 class TestAdminAuthLogin(TestAdminAuth):
     """Test cases for AdminAuth.login method."""
 
-    @pytest.mark.asyncio
     async def test_login_success(
         self,
         admin_auth: AdminAuth,
-        mock_request: MagicMock,
+        mock_request: SimpleNamespace,
         mock_form_async: AsyncMock,
         mock_user_repository: AsyncMock,
         mock_uow: AsyncMock,
-        mock_user_admin: MockUser,
+        mock_user_admin: MockAdminUser,
     ) -> None:
         """Test successful login."""
         # Setup mocks
@@ -138,11 +132,10 @@ class TestAdminAuthLogin(TestAdminAuth):
         assert "token" in mock_request.session
         mock_user_repository.get_by_username.assert_called_once_with(username="admin")
 
-    @pytest.mark.asyncio
     async def test_login_user_not_found(
         self,
         admin_auth: AdminAuth,
-        mock_request: MagicMock,
+        mock_request: SimpleNamespace,
         mock_form_async: AsyncMock,
         mock_user_repository: AsyncMock,
         mock_uow: AsyncMock,
@@ -160,15 +153,14 @@ class TestAdminAuthLogin(TestAdminAuth):
         assert result is False
         assert "token" not in mock_request.session
 
-    @pytest.mark.asyncio
     async def test_login_invalid_password(
         self,
         admin_auth: AdminAuth,
-        mock_request: MagicMock,
+        mock_request: SimpleNamespace,
         mock_form_async: AsyncMock,
         mock_user_repository: AsyncMock,
         mock_uow: AsyncMock,
-        mock_user_admin: MockUser,
+        mock_user_admin: MockAdminUser,
     ) -> None:
         """Test login with invalid password."""
         # Setup mocks
@@ -176,7 +168,7 @@ class TestAdminAuthLogin(TestAdminAuth):
         mock_user_repository.get_by_username.return_value = mock_user_admin
         mock_uow.session = MagicMock()
         # Mock verify_password to return False
-        mock_user_admin.verify_password = MagicMock(return_value=False)
+        mock_user_admin.verify_password.return_value = False
 
         # Execute
         result = await admin_auth.login(mock_request)
@@ -185,15 +177,14 @@ class TestAdminAuthLogin(TestAdminAuth):
         assert result is False
         assert "token" not in mock_request.session
 
-    @pytest.mark.asyncio
     async def test_login_user_inactive(
         self,
         admin_auth: AdminAuth,
-        mock_request: MagicMock,
+        mock_request: SimpleNamespace,
         mock_form_async: AsyncMock,
         mock_user_repository: AsyncMock,
         mock_uow: AsyncMock,
-        mock_user_inactive: MockUser,
+        mock_user_inactive: MockAdminUser,
     ) -> None:
         """Test login with inactive user."""
         # Setup mocks
@@ -209,15 +200,14 @@ class TestAdminAuthLogin(TestAdminAuth):
         assert result is False
         assert "token" not in mock_request.session
 
-    @pytest.mark.asyncio
     async def test_login_user_not_admin(
         self,
         admin_auth: AdminAuth,
-        mock_request: MagicMock,
+        mock_request: SimpleNamespace,
         mock_form_async: AsyncMock,
         mock_user_repository: AsyncMock,
         mock_uow: AsyncMock,
-        mock_user_regular: MockUser,
+        mock_user_regular: MockAdminUser,
     ) -> None:
         """Test login with non-admin user."""
         # Setup mocks
@@ -237,11 +227,10 @@ class TestAdminAuthLogin(TestAdminAuth):
 class TestAdminAuthLogout(TestAdminAuth):
     """Test cases for AdminAuth.logout method."""
 
-    @pytest.mark.asyncio
     async def test_logout_success(
         self,
         admin_auth: AdminAuth,
-        mock_request: MagicMock,
+        mock_request: SimpleNamespace,
     ) -> None:
         """Test successful logout."""
         # Setup - add some session data
@@ -254,11 +243,10 @@ class TestAdminAuthLogout(TestAdminAuth):
         assert result is True
         assert mock_request.session == {}
 
-    @pytest.mark.asyncio
     async def test_logout_empty_session(
         self,
         admin_auth: AdminAuth,
-        mock_request: MagicMock,
+        mock_request: SimpleNamespace,
     ) -> None:
         """Test logout with empty session."""
         # Setup - empty session
@@ -275,14 +263,13 @@ class TestAdminAuthLogout(TestAdminAuth):
 class TestAdminAuthAuthenticate(TestAdminAuth):
     """Test cases for AdminAuth.authenticate method."""
 
-    @pytest.mark.asyncio
     async def test_authenticate_success(
         self,
         admin_auth: AdminAuth,
-        mock_request: MagicMock,
+        mock_request: SimpleNamespace,
         mock_user_repository: AsyncMock,
         mock_uow: AsyncMock,
-        mock_user_admin: MockUser,
+        mock_user_admin: MockAdminUser,
     ) -> None:
         """Test successful authentication."""
         # Setup mocks
@@ -299,11 +286,10 @@ class TestAdminAuthAuthenticate(TestAdminAuth):
         assert result is True
         mock_user_repository.first.assert_called_once_with(instance_id=1)
 
-    @pytest.mark.asyncio
     async def test_authenticate_no_token(
         self,
         admin_auth: AdminAuth,
-        mock_request: MagicMock,
+        mock_request: SimpleNamespace,
     ) -> None:
         """Test authentication with no token in session."""
         # Setup - no token in session
@@ -315,11 +301,10 @@ class TestAdminAuthAuthenticate(TestAdminAuth):
         # Verify
         assert result is False
 
-    @pytest.mark.asyncio
     async def test_authenticate_invalid_token(
         self,
         admin_auth: AdminAuth,
-        mock_request: MagicMock,
+        mock_request: SimpleNamespace,
     ) -> None:
         """Test authentication with invalid token."""
         # Setup
@@ -333,11 +318,10 @@ class TestAdminAuthAuthenticate(TestAdminAuth):
         # Verify
         assert result is False
 
-    @pytest.mark.asyncio
     async def test_authenticate_user_not_found(
         self,
         admin_auth: AdminAuth,
-        mock_request: MagicMock,
+        mock_request: SimpleNamespace,
         mock_user_repository: AsyncMock,
         mock_uow: AsyncMock,
     ) -> None:
@@ -355,14 +339,13 @@ class TestAdminAuthAuthenticate(TestAdminAuth):
         # Verify
         assert result is False
 
-    @pytest.mark.asyncio
     async def test_authenticate_user_inactive(
         self,
         admin_auth: AdminAuth,
-        mock_request: MagicMock,
+        mock_request: SimpleNamespace,
         mock_user_repository: AsyncMock,
         mock_uow: AsyncMock,
-        mock_user_inactive: MockUser,
+        mock_user_inactive: MockAdminUser,
     ) -> None:
         """Test authentication with inactive user."""
         # Setup mocks
@@ -378,14 +361,13 @@ class TestAdminAuthAuthenticate(TestAdminAuth):
         # Verify
         assert result is False
 
-    @pytest.mark.asyncio
     async def test_authenticate_user_not_admin(
         self,
         admin_auth: AdminAuth,
-        mock_request: MagicMock,
+        mock_request: SimpleNamespace,
         mock_user_repository: AsyncMock,
         mock_uow: AsyncMock,
-        mock_user_regular: MockUser,
+        mock_user_regular: MockAdminUser,
     ) -> None:
         """Test authentication with non-admin user."""
         # Setup mocks
@@ -474,7 +456,7 @@ class TestAdminAuthCheckUser(TestAdminAuth):
 
     def test_check_user_success_with_password(
         self,
-        mock_user_admin: MockUser,
+        mock_user_admin: MockAdminUser,
     ) -> None:
         """Test successful user check with password verification."""
         # Setup
@@ -492,7 +474,7 @@ class TestAdminAuthCheckUser(TestAdminAuth):
 
     def test_check_user_success_without_password(
         self,
-        mock_user_admin: MockUser,
+        mock_user_admin: MockAdminUser,
     ) -> None:
         """Test successful user check without password verification."""
         # Execute
@@ -515,7 +497,7 @@ class TestAdminAuthCheckUser(TestAdminAuth):
 
     def test_check_user_invalid_password(
         self,
-        mock_user_admin: MockUser,
+        mock_user_admin: MockAdminUser,
     ) -> None:
         """Test user check with invalid password."""
         # Setup
@@ -532,7 +514,7 @@ class TestAdminAuthCheckUser(TestAdminAuth):
 
     def test_check_user_inactive(
         self,
-        mock_user_inactive: MockUser,
+        mock_user_inactive: MockAdminUser,
     ) -> None:
         """Test user check with inactive user."""
         # Execute
@@ -544,7 +526,7 @@ class TestAdminAuthCheckUser(TestAdminAuth):
 
     def test_check_user_not_admin(
         self,
-        mock_user_regular: MockUser,
+        mock_user_regular: MockAdminUser,
     ) -> None:
         """Test user check with non-admin user."""
         # Execute
@@ -558,11 +540,10 @@ class TestAdminAuthCheckUser(TestAdminAuth):
 class TestAdminAuthEdgeCases(TestAdminAuth):
     """Test cases for AdminAuth edge cases and error handling."""
 
-    @pytest.mark.asyncio
     async def test_login_database_error(
         self,
         admin_auth: AdminAuth,
-        mock_request: MagicMock,
+        mock_request: SimpleNamespace,
         mock_form_async: AsyncMock,
         mock_user_repository: AsyncMock,
         mock_uow: AsyncMock,
@@ -577,11 +558,10 @@ class TestAdminAuthEdgeCases(TestAdminAuth):
         with pytest.raises(Exception, match="Database error"):
             await admin_auth.login(mock_request)
 
-    @pytest.mark.asyncio
     async def test_authenticate_database_error(
         self,
         admin_auth: AdminAuth,
-        mock_request: MagicMock,
+        mock_request: SimpleNamespace,
         mock_user_repository: AsyncMock,
         mock_uow: AsyncMock,
     ) -> None:
@@ -624,7 +604,7 @@ class TestAdminAuthEdgeCases(TestAdminAuth):
 
     def test_check_user_with_string_identity(
         self,
-        mock_user_admin: MockUser,
+        mock_user_admin: MockAdminUser,
     ) -> None:
         """Test user check with string identity."""
         # Execute
@@ -636,7 +616,7 @@ class TestAdminAuthEdgeCases(TestAdminAuth):
 
     def test_check_user_with_int_identity(
         self,
-        mock_user_admin: MockUser,
+        mock_user_admin: MockAdminUser,
     ) -> None:
         """Test user check with integer identity."""
         # Execute
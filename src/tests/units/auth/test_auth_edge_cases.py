@@ -1,6 +1,8 @@
 import datetime
+import hashlib
+from types import SimpleNamespace
+from typing import Callable
 import pytest
-from unittest.mock import MagicMock
 from pydantic import SecretStr
 from starlette.exceptions import HTTPException
 
@@ -17,7 +19,10 @@ from src.modules.auth.hashers import (
 )
 from src.utils import utcnow
 from src.settings import AppSettings
-from src.tests.mocks import MockAPIToken
+from src.tests.mocks import HEX_PATTERN, MockAPIToken, MockRequest
+
+LONG_STRING_1K = "a" * 1000
+LONG_STRING_10K = "a" * 10000
 
 
 class TestTokenEdgeCases:
@@ -25,18 +30,16 @@ class TestTokenEdgeCases:
         "secret_key",
         [
             pytest.param("", id="empty"),
-            pytest.param("a" * 1000, id="long"),
+            pytest.param(LONG_STRING_1K, id="long"),
             pytest.param("!@#$%^&*()_+-=[]{}|;:,.<>?`~", id="special-characters"),
             pytest.param("секретный-ключ", id="unicode"),
         ],
     )
-    def test_token_with_various_secret_key(self, secret_key: str) -> None:
-        app_settings = AppSettings(
-            admin_username="test-username",
-            admin_password=SecretStr("test-password"),
-            app_secret_key=SecretStr(secret_key),
-            vendor_encryption_key=SecretStr(""),
-            jwt_algorithm="HS256",
+    def test_token_with_various_secret_key(
+        self, app_settings_test: AppSettings, secret_key: str
+    ) -> None:
+        app_settings = app_settings_test.model_copy(
+            update={"app_secret_key": SecretStr(secret_key)}
         )
 
         generated = make_api_token(expires_at=None, settings=app_settings)
@@ -46,44 +49,38 @@ class TestTokenEdgeCases:
         decoded = decode_api_token(generated.value, app_settings)
         assert decoded.sub is not None
 
-    def test_token_with_minimal_expiration(self, app_settings_test: AppSettings) -> None:
-        minimal_exp = utcnow(skip_tz=False) + datetime.timedelta(seconds=1)
-        generated = make_api_token(expires_at=minimal_exp, settings=app_settings_test)
-
-        # Should be decodable immediately
-        decoded = decode_api_token(generated.value, app_settings_test)
-        assert decoded.exp == minimal_exp.replace(microsecond=0)
-
-    def test_token_with_maximum_expiration(self, app_settings_test: AppSettings) -> None:
-        max_exp = datetime.datetime.max
-        generated = make_api_token(expires_at=max_exp, settings=app_settings_test)
-
-        decoded = decode_api_token(generated.value, app_settings_test)
-        assert decoded.exp == max_exp.replace(microsecond=0, tzinfo=datetime.timezone.utc)
-
-    def test_token_with_negative_expiration(self, app_settings_test: AppSettings) -> None:
-        past_time = utcnow(skip_tz=False) - datetime.timedelta(hours=1)
-        generated = make_api_token(expires_at=past_time, settings=app_settings_test)
-
-        # Should raise exception when decoding
-        with pytest.raises(HTTPException) as exc_info:
-            decode_api_token(generated.value, app_settings_test)
-
-        assert exc_info.value.status_code == 401
-        assert "Token expired" in str(exc_info.value.detail)
-
-    def test_token_with_exactly_current_time_expiration(
-        self, app_settings_test: AppSettings
+    @pytest.mark.parametrize(
+        "make_expires_at,expired",
+        [
+            pytest.param(
+                lambda: utcnow(skip_tz=False) + datetime.timedelta(seconds=1), False, id="minimal"
+            ),
+            pytest.param(lambda: datetime.datetime.max, False, id="maximum"),
+            pytest.param(
+                lambda: utcnow(skip_tz=False) - datetime.timedelta(hours=1), True, id="negative"
+            ),
+            pytest.param(lambda: utcnow(skip_tz=False), True, id="exactly_current_time"),
+        ],
+    )
+    def test_token_expiration(
+        self,
+        app_settings_test: AppSettings,
+        make_expires_at: Callable[[], datetime.datetime],
+        expired: bool,
     ) -> None:
-        current_time = utcnow(skip_tz=False)
-        generated = make_api_token(expires_at=current_time, settings=app_settings_test)
+        expires_at = make_expires_at()
+        generated = make_api_token(expires_at=expires_at, settings=app_settings_test)
 
-        # Should raise exception when decoding (expired)
-        with pytest.raises(HTTPException) as exc_info:
-            decode_api_token(generated.value, app_settings_test)
+        if expired:
+            with pytest.raises(HTTPException) as exc_info:
+                decode_api_token(generated.value, app_settings_test)
 
-        assert exc_info.value.status_code == 401
-        assert "Token expired" in str(exc_info.value.detail)
+            assert exc_info.value.status_code == 401
+            assert "Token expired" in str(exc_info.value.detail)
+
+        else:
+            decoded = decode_api_token(generated.value, app_settings_test)
+            assert decoded.exp == expires_at.replace(microsecond=0, tzinfo=datetime.timezone.utc)
 
     @pytest.mark.parametrize(
         "token_string,expected_detail_contains",
@@ -115,7 +112,7 @@ class TestTokenEdgeCases:
         "input_string",
         [
             pytest.param("", id="empty_string"),
-            pytest.param("a" * 10000, id="very_long_string"),
+            pytest.param(LONG_STRING_10K, id="very_long_string"),
             pytest.param("тест-строка-测试字符串", id="unicode_string"),
             pytest.param("!@#$%^&*()_+-=[]{}|;:,.<>?`~", id="special_characters"),
             pytest.param(
@@ -127,14 +124,19 @@ class TestTokenEdgeCases:
     def test_hash_token_edge_cases(self, input_string: str) -> None:
         hashed = hash_token(input_string)
 
-        assert isinstance(hashed, str)
-        assert len(hashed) == 128  # SHA-512 hex digest length
+        assert hashed == hashlib.sha512(input_string.encode()).hexdigest()
+
+
+class FastPBKDF2PasswordHasher(PBKDF2PasswordHasher):
+    """Same encoding format, but without key stretching: edge cases don't depend on iterations"""
+
+    iterations = 1
 
 
 class TestPasswordHasherEdgeCases:
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def hasher(self) -> PBKDF2PasswordHasher:
-        return PBKDF2PasswordHasher()
+        return FastPBKDF2PasswordHasher()
 
     @pytest.mark.parametrize(
         "password",
@@ -154,7 +156,7 @@ class TestPasswordHasherEdgeCases:
     @pytest.mark.parametrize(
         "password",
         [
-            pytest.param("a" * 10000, id="very_long_password"),
+            pytest.param(LONG_STRING_10K, id="very_long_password"),
             pytest.param("тест-пароль-с-юникодом-测试密码", id="unicode_char"),
             pytest.param("!@#$%^&*()_+-=[]{}|;:,.<>?`~", id="special_char"),
             pytest.param("password\x00with\x00nulls", id="null_bytes"),
@@ -183,13 +185,6 @@ class TestPasswordHasherEdgeCases:
                 "extra parts detected",
                 id="extra_parts",
             ),
-            pytest.param(
-                "test-password",
-                "pbkdf2_sha256$999999$salt$hash",
-                False,
-                "",
-                id="wrong_iterations",
-            ),
             pytest.param(
                 "test-password",
                 "pbkdf2_sha256$invalid$salt$hash",
@@ -249,39 +244,35 @@ class TestPasswordHasherEdgeCases:
             with pytest.raises(ValueError) as exc:
                 get_random_hash(size=size)
 
-            assert "digest_size must be between 1 and 64 bytes" in exc.value.args[0]
+            assert "size must be between 1 and 64" in exc.value.args[0]
 
         else:
             hash_result = get_random_hash(size=size)
             assert len(hash_result) == expected_size
-            assert all(c in "0123456789abcdef" for c in hash_result)
+            assert HEX_PATTERN.fullmatch(hash_result)
 
 
 class TestAuthDependencyEdgeCases:
     @pytest.mark.parametrize(
-        "auth_token,should_raise,expected_detail_contains",
+        "auth_token",
         [
-            pytest.param("   ", True, "Not authenticated", id="whitespace_only"),
-            pytest.param("\tBearer\t", True, "Not authenticated", id="tab_characters"),
-            pytest.param("Bearer\n", True, "Not authenticated", id="newline_characters"),
-            pytest.param("\u2003Bearer\u2003", True, "Not authenticated", id="unicode_whitespace"),
+            pytest.param("   ", id="whitespace_only"),
+            pytest.param("\tBearer\t", id="tab_characters"),
+            pytest.param("Bearer\n", id="newline_characters"),
+            pytest.param("\u2003Bearer\u2003", id="unicode_whitespace"),
         ],
     )
-    @pytest.mark.asyncio
     async def test_verify_api_token_with_whitespace_edge_cases(
         self,
         app_settings_test: AppSettings,
-        mock_request: MagicMock,
+        mock_request: MockRequest,
         auth_token: str,
-        should_raise: bool,
-        expected_detail_contains: str,
     ) -> None:
-        if should_raise:
-            with pytest.raises(HTTPException) as exc_info:
-                await verify_api_token(mock_request, app_settings_test, auth_token=auth_token)
+        with pytest.raises(HTTPException) as exc_info:
+            await verify_api_token(mock_request, app_settings_test, auth_token=auth_token)
 
-            assert exc_info.value.status_code == 401
-            assert expected_detail_contains in str(exc_info.value.detail)
+        assert exc_info.value.status_code == 401
+        assert "Not authenticated" in str(exc_info.value.detail)
 
     @pytest.mark.parametrize(
         "auth_token,description",
@@ -290,13 +281,11 @@ class TestAuthDependencyEdgeCases:
             pytest.param("BeArEr test-token-value", "mixed case bearer", id="mixed_case_bearer"),
         ],
     )
-    @pytest.mark.asyncio
     async def test_verify_api_token_with_case_insensitive_bearer(
         self,
         app_settings_test: AppSettings,
-        mock_request: MagicMock,
-        mock_decode_token: MagicMock,
-        mock_hash_token: MagicMock,
+        mock_request: MockRequest,
+        auth_pipeline: SimpleNamespace,
         mock_db_api_token__active: MockAPIToken,
         auth_token: str,
         description: str,
@@ -7,6 +7,9 @@ from src.modules.auth.hashers import (
     get_random_hash,
     PBKDF2PasswordHasher,
 )
+from src.tests.mocks import HEX_PATTERN
+
+TEST_PASSWORD = "test-password-123"
 
 
 class TestGetSalt:
@@ -66,31 +69,34 @@ class TestGetRandomHash:
         hash_value = get_random_hash(size=16)
 
         # Should contain only hexadecimal characters
-        assert all(c in "0123456789abcdef" for c in hash_value)
+        assert HEX_PATTERN.fullmatch(hash_value)
 
 
+@pytest.mark.slow
 class TestPBKDF2PasswordHasher:
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def hasher(self) -> PBKDF2PasswordHasher:
         """Return PBKDF2PasswordHasher instance."""
         return PBKDF2PasswordHasher()
 
+    @pytest.fixture(scope="class")
+    def encoded_password(self, hasher: PBKDF2PasswordHasher) -> str:
+        """Encoded TEST_PASSWORD (with random salt), computed once for the whole class."""
+        return hasher.encode(TEST_PASSWORD)
+
     def test_hasher_attributes(self, hasher: PBKDF2PasswordHasher) -> None:
         assert hasher.algorithm == "pbkdf2_sha256"
         assert hasher.iterations == 180000
         assert hasher.digest == hashlib.sha256
 
-    def test_encode_basic(self, hasher: PBKDF2PasswordHasher) -> None:
-        password = "test-password-123"
-        encoded = hasher.encode(password)
-
-        assert isinstance(encoded, str)
-        assert encoded.startswith("pbkdf2_sha256$")
-        assert encoded.count("$") == 3
+    def test_encode_basic(self, encoded_password: str) -> None:
+        assert isinstance(encoded_password, str)
+        assert encoded_password.startswith("pbkdf2_sha256$")
+        assert encoded_password.count("$") == 3
 
     def test_encode_with_custom_salt(self, hasher: PBKDF2PasswordHasher) -> None:
-        password = "test-password-123"
+        password = TEST_PASSWORD
         salt = "custom-salt-123"
         encoded = hasher.encode(password, salt)
 
@@ -98,11 +104,8 @@ class TestPBKDF2PasswordHasher:
         assert encoded.startswith("pbkdf2_sha256$")
         assert salt in encoded
 
-    def test_encode_format(self, hasher: PBKDF2PasswordHasher) -> None:
-        password = "test-password-123"
-        encoded = hasher.encode(password)
-
-        parts = encoded.split("$")
+    def test_encode_format(self, encoded_password: str) -> None:
+        parts = encoded_password.split("$")
         assert len(parts) == 4
         assert parts[0] == "pbkdf2_sha256"
         assert parts[1] == "180000"
@@ -128,27 +131,24 @@ class TestPBKDF2PasswordHasher:
 
         assert encoded1 != encoded2
 
-    def test_verify_correct_password(self, hasher: PBKDF2PasswordHasher) -> None:
-        password = "test-password-123"
-        encoded = hasher.encode(password)
-
-        is_valid, message = hasher.verify(password, encoded)
+    def test_verify_correct_password(
+        self, hasher: PBKDF2PasswordHasher, encoded_password: str
+    ) -> None:
+        is_valid, message = hasher.verify(TEST_PASSWORD, encoded_password)
 
         assert is_valid is True
         assert message == ""
 
-    def test_verify_incorrect_password(self, hasher: PBKDF2PasswordHasher) -> None:
-        password = "test-password-123"
-        wrong_password = "wrong-password"
-        encoded = hasher.encode(password)
-
-        is_valid, message = hasher.verify(wrong_password, encoded)
+    def test_verify_incorrect_password(
+        self, hasher: PBKDF2PasswordHasher, encoded_password: str
+    ) -> None:
+        is_valid, message = hasher.verify("wrong-password", encoded_password)
 
         assert is_valid is False
         assert message == ""
 
     def test_verify_with_custom_salt(self, hasher: PBKDF2PasswordHasher) -> None:
-        password = "test-password-123"
+        password = TEST_PASSWORD
         salt = "custom-salt-123"
         encoded = hasher.encode(password, salt)
 
@@ -157,8 +157,19 @@ class TestPBKDF2PasswordHasher:
         assert is_valid is True
         assert message == ""
 
+    def test_verify_wrong_iterations(
+        self, hasher: PBKDF2PasswordHasher, encoded_password: str
+    ) -> None:
+        algorithm, _, salt, hash_value = encoded_password.split("$")
+        wrong_iterations_encoded = f"{algorithm}$999999${salt}${hash_value}"
+
+        is_valid, message = hasher.verify(TEST_PASSWORD, wrong_iterations_encoded)
+
+        assert is_valid is False
+        assert message == ""
+
     def test_verify_malformed_encoded_password(self, hasher: PBKDF2PasswordHasher) -> None:
-        password = "test-password-123"
+        password = TEST_PASSWORD
         malformed_encoded = "invalid-format"
 
         is_valid, message = hasher.verify(password, malformed_encoded)
@@ -167,7 +178,7 @@ class TestPBKDF2PasswordHasher:
         assert "incompatible format" in message
 
     def test_verify_wrong_algorithm(self, hasher: PBKDF2PasswordHasher) -> None:
-        password = "test-password-123"
+        password = TEST_PASSWORD
         wrong_algorithm_encoded = "wrong_algorithm$180000$salt$hash"
 
         is_valid, message = hasher.verify(password, wrong_algorithm_encoded)
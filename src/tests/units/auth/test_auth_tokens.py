@@ -1,8 +1,11 @@
 import datetime
+from typing import Any, Generator
+
 import pytest
-from unittest.mock import MagicMock, AsyncMock
+from unittest.mock import AsyncMock, patch
 from starlette.exceptions import HTTPException
 
+from src.modules.auth import tokens
 from src.modules.auth.tokens import (
     JWTPayload,
     jwt_encode,
@@ -14,7 +17,7 @@ from src.modules.auth.tokens import (
     GeneratedToken,
 )
 from src.settings import AppSettings
-from src.tests.mocks import MockAPIToken
+from src.tests.mocks import MockAPIToken, MockRequest, MockTokenState
 from src.utils import utcnow
 
 
@@ -145,6 +148,37 @@ class TestDecodeAPIToken:
         assert "Invalid token" in str(exc_info.value.detail)
 
 
+class TestJWTHeaderPartCache:
+
+    @pytest.fixture(autouse=True)
+    def _clear_header_parts(self) -> Generator[None, Any, None]:
+        with patch.dict(tokens._JWT_HEADER_PARTS, clear=True):
+            yield
+
+    def test_decode_reuses_cached_header(self, app_settings_test: AppSettings) -> None:
+        generated = make_api_token(expires_at=None, settings=app_settings_test)
+
+        with patch.object(tokens, "jwt_encode", wraps=jwt_encode) as mock_jwt_encode:
+            first = decode_api_token(generated.value, app_settings_test)
+            second = decode_api_token(generated.value, app_settings_test)
+
+        assert first.sub == second.sub
+        mock_jwt_encode.assert_called_once()
+        assert list(tokens._JWT_HEADER_PARTS) == ["HS256"]
+
+    def test_header_cached_per_algorithm(self, app_settings_test: AppSettings) -> None:
+        hs512_settings = app_settings_test.model_copy(update={"jwt_algorithm": "HS512"})
+
+        for settings in (app_settings_test, hs512_settings):
+            generated = make_api_token(expires_at=None, settings=settings)
+            decoded = decode_api_token(generated.value, settings)
+            assert isinstance(decoded, JWTPayload)
+
+        header_parts = tokens._JWT_HEADER_PARTS
+        assert set(header_parts) == {"HS256", "HS512"}
+        assert header_parts["HS256"] != header_parts["HS512"]
+
+
 class TestHashToken:
 
     def test_hash_token_basic(self) -> None:
@@ -178,20 +212,17 @@ class TestHashToken:
         assert len(hashed) == 128
 
 
-@pytest.mark.asyncio
 class TestVerifyAPIToken:
 
     async def test_verify_api_token_options_method(
-        self, app_settings_test: AppSettings, mock_request: MagicMock
+        self, app_settings_test: AppSettings, options_request: MockRequest
     ) -> None:
-        mock_request.method = "OPTIONS"
-
-        result = await verify_api_token(mock_request, app_settings_test, auth_token=None)
+        result = await verify_api_token(options_request, app_settings_test, auth_token=None)
 
         assert result == ""
 
     async def test_verify_api_token_no_token(
-        self, app_settings_test: AppSettings, mock_request: MagicMock
+        self, app_settings_test: AppSettings, mock_request: MockRequest
     ) -> None:
         with pytest.raises(HTTPException) as exc_info:
             await verify_api_token(mock_request, app_settings_test, auth_token=None)
@@ -202,7 +233,7 @@ class TestVerifyAPIToken:
     async def test_verify_api_token_with_bearer_prefix(
         self,
         app_settings_test: AppSettings,
-        mock_request: MagicMock,
+        mock_request: MockRequest,
         mock_db_api_token__active: MockAPIToken,
     ) -> None:
         generated_token = make_api_token(expires_at=None, settings=app_settings_test)
@@ -213,11 +244,12 @@ class TestVerifyAPIToken:
         )
         assert result == generated_token.value
 
+    @pytest.mark.parametrize("token_repo", [MockTokenState(token_active=False)], indirect=True)
     async def test_verify_api_token_inactive_token(
         self,
         app_settings_test: AppSettings,
-        mock_request: MagicMock,
-        mock_db_api_token__inactive: MockAPIToken,
+        mock_request: MockRequest,
+        token_repo: AsyncMock,
     ) -> None:
         generated = make_api_token(expires_at=None, settings=app_settings_test)
         auth_token = f"Bearer {generated.value}"
@@ -228,11 +260,12 @@ class TestVerifyAPIToken:
         assert exc_info.value.status_code == 401
         assert "inactive token" in str(exc_info.value.detail)
 
+    @pytest.mark.parametrize("token_repo", [MockTokenState(user_active=False)], indirect=True)
     async def test_verify_api_token_inactive_user(
         self,
         app_settings_test: AppSettings,
-        mock_request: MagicMock,
-        mock_db_api_token__user_inactive: MockAPIToken,
+        mock_request: MockRequest,
+        token_repo: AsyncMock,
     ) -> None:
         generated = make_api_token(expires_at=None, settings=app_settings_test)
         auth_token = f"Bearer {generated.value}"
@@ -243,11 +276,12 @@ class TestVerifyAPIToken:
         assert exc_info.value.status_code == 401
         assert "user is not active" in str(exc_info.value.detail)
 
+    @pytest.mark.parametrize("token_repo", [MockTokenState(exists=False)], indirect=True)
     async def test_verify_api_token_unknown_token(
         self,
         app_settings_test: AppSettings,
-        mock_request: MagicMock,
-        mock_db_api_token__unknown: AsyncMock,
+        mock_request: MockRequest,
+        token_repo: AsyncMock,
     ) -> None:
         generated = make_api_token(expires_at=None, settings=app_settings_test)
         auth_token = f"Bearer {generated.value}"
@@ -1,7 +1,9 @@
 from datetime import timedelta
+from types import SimpleNamespace
+from typing import Callable
 
 import pytest
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock
 
 from starlette.exceptions import HTTPException
 
@@ -9,57 +11,50 @@ from src.modules.auth.dependencies import verify_api_token
 from src.modules.auth.tokens import make_api_token
 from src.settings import AppSettings
 from src.utils import utcnow
-from src.tests.mocks import MockAPIToken
+from src.tests.mocks import MockAPIToken, MockRequest, MockTokenState
 
 
-@pytest.mark.asyncio
 class TestVerifyAPIToken:
 
-    async def test_verify_api_token_dependency_import(self) -> None:
-        from src.modules.auth.dependencies import verify_api_token
-
+    def test_verify_api_token_dependency_import(self) -> None:
         assert callable(verify_api_token)
 
     async def test_verify_api_token_options_method(
-        self, app_settings_test: AppSettings, mock_request: MagicMock
+        self, app_settings_test: AppSettings, options_request: MockRequest
     ) -> None:
-        mock_request.method = "OPTIONS"
-
-        result = await verify_api_token(mock_request, app_settings_test, auth_token=None)
+        result = await verify_api_token(options_request, app_settings_test, auth_token=None)
 
         assert result == ""
 
-    async def test_verify_api_token_no_token(
-        self, app_settings_test: AppSettings, mock_request: MagicMock
-    ) -> None:
-        with pytest.raises(HTTPException) as exc_info:
-            await verify_api_token(mock_request, app_settings_test, auth_token=None)
-
-        assert exc_info.value.status_code == 401
-        assert "Not authenticated" in str(exc_info.value.detail)
-
-    async def test_verify_api_token_empty_token(
-        self, app_settings_test: AppSettings, mock_request: MagicMock
-    ) -> None:
-        with pytest.raises(HTTPException) as exc_info:
-            await verify_api_token(mock_request, app_settings_test, auth_token="")
-
-        assert exc_info.value.status_code == 401
-        assert "Not authenticated" in str(exc_info.value.detail)
-
-    async def test_verify_api_token_whitespace_token(
-        self, app_settings_test: AppSettings, mock_request: MagicMock
+    @pytest.mark.parametrize(
+        "auth_token, mock_decode_token, expected_detail",
+        [
+            pytest.param(None, "ok", "Not authenticated", id="no-token"),
+            pytest.param("", "ok", "Not authenticated", id="empty-token"),
+            pytest.param("   ", "ok", "Not authenticated", id="whitespace-token"),
+            pytest.param("test-token", "empty", "token has no identity", id="no-identity"),
+            pytest.param("test-token", "none", "token has no identity", id="none-identity"),
+        ],
+        indirect=["mock_decode_token"],
+    )
+    async def test_verify_api_token_rejected(
+        self,
+        app_settings_test: AppSettings,
+        mock_request: MockRequest,
+        mock_decode_token: Callable[..., SimpleNamespace],
+        auth_token: str | None,
+        expected_detail: str,
     ) -> None:
         with pytest.raises(HTTPException) as exc_info:
-            await verify_api_token(mock_request, app_settings_test, auth_token="   ")
+            await verify_api_token(mock_request, app_settings_test, auth_token=auth_token)
 
         assert exc_info.value.status_code == 401
-        assert "Not authenticated" in str(exc_info.value.detail)
+        assert expected_detail in str(exc_info.value.detail)
 
     async def test_verify_api_token_with_bearer_prefix(
         self,
         app_settings_test: AppSettings,
-        mock_request: MagicMock,
+        mock_request: MockRequest,
         mock_db_api_token__active: MockAPIToken,
     ) -> None:
         auth_token = make_api_token(
@@ -77,22 +72,21 @@ class TestVerifyAPIToken:
     async def test_verify_api_token_without_bearer_prefix(
         self,
         app_settings_test: AppSettings,
-        mock_request: MagicMock,
-        mock_decode_token: MagicMock,
-        mock_hash_token: MagicMock,
+        mock_request: MockRequest,
+        auth_pipeline: SimpleNamespace,
         mock_db_api_token__active: MockAPIToken,
     ) -> None:
         auth_token = "test-token-value"
         result = await verify_api_token(mock_request, app_settings_test, auth_token=auth_token)
         assert result == auth_token
 
+    @pytest.mark.parametrize("token_repo", [MockTokenState(token_active=False)], indirect=True)
     async def test_verify_api_token_inactive_token(
         self,
         app_settings_test: AppSettings,
-        mock_request: MagicMock,
-        mock_decode_token: MagicMock,
-        mock_hash_token: MagicMock,
-        mock_db_api_token__inactive: MockAPIToken,
+        mock_request: MockRequest,
+        auth_pipeline: SimpleNamespace,
+        token_repo: AsyncMock,
     ) -> None:
         with pytest.raises(HTTPException) as exc_info:
             await verify_api_token(mock_request, app_settings_test, auth_token="test-token")
@@ -100,13 +94,13 @@ class TestVerifyAPIToken:
         assert exc_info.value.status_code == 401
         assert "inactive token" in str(exc_info.value.detail)
 
+    @pytest.mark.parametrize("token_repo", [MockTokenState(user_active=False)], indirect=True)
     async def test_verify_api_token_inactive_user(
         self,
         app_settings_test: AppSettings,
-        mock_request: MagicMock,
-        mock_decode_token: MagicMock,
-        mock_hash_token: MagicMock,
-        mock_db_api_token__user_inactive: MockAPIToken,
+        mock_request: MockRequest,
+        auth_pipeline: SimpleNamespace,
+        token_repo: AsyncMock,
     ) -> None:
         with pytest.raises(HTTPException) as exc_info:
             await verify_api_token(mock_request, app_settings_test, auth_token="test-token")
@@ -114,63 +108,42 @@ class TestVerifyAPIToken:
         assert exc_info.value.status_code == 401
         assert "user is not active" in str(exc_info.value.detail)
 
+    @pytest.mark.parametrize("token_repo", [MockTokenState(exists=False)], indirect=True)
     async def test_verify_api_token_unknown_token(
         self,
         app_settings_test: AppSettings,
-        mock_request: MagicMock,
-        mock_decode_token: MagicMock,
-        mock_hash_token: MagicMock,
-        mock_db_api_token__unknown: AsyncMock,
+        mock_request: MockRequest,
+        auth_pipeline: SimpleNamespace,
+        token_repo: AsyncMock,
     ) -> None:
         with pytest.raises(HTTPException) as exc_info:
             await verify_api_token(mock_request, app_settings_test, auth_token="test-token")
 
         assert exc_info.value.status_code == 401
         assert "unknown token" in str(exc_info.value.detail)
-        mock_db_api_token__unknown.assert_awaited_with(mock_hash_token.return_value)
-
-    async def test_verify_api_token_no_identity(
-        self,
-        app_settings_test: AppSettings,
-        mock_request: MagicMock,
-        mock_decode_token__no_identity: MagicMock,
-    ) -> None:
-        with pytest.raises(HTTPException) as exc_info:
-            await verify_api_token(mock_request, app_settings_test, auth_token="test-token")
-
-        assert exc_info.value.status_code == 401
-        assert "token has no identity" in str(exc_info.value.detail)
-
-    async def test_verify_api_token_none_identity(
-        self,
-        app_settings_test: AppSettings,
-        mock_request: MagicMock,
-        mock_decode_token__none_identity: MagicMock,
-    ) -> None:
-        with pytest.raises(HTTPException) as exc_info:
-            await verify_api_token(mock_request, app_settings_test, auth_token="test-token")
-
-        assert exc_info.value.status_code == 401
-        assert "token has no identity" in str(exc_info.value.detail)
+        token_repo.assert_awaited_with(auth_pipeline.hash_token.return_value)
 
+    @pytest.mark.parametrize(
+        "token_repo", [MockTokenState(raises=RuntimeError("Database error"))], indirect=True
+    )
     async def test_verify_api_token_database_error(
         self,
         app_settings_test: AppSettings,
-        mock_request: MagicMock,
-        mock_decode_token: MagicMock,
-        mock_hash_token: MagicMock,
-        mock_db_api_token__repository_error: AsyncMock,
+        mock_request: MockRequest,
+        auth_pipeline: SimpleNamespace,
+        token_repo: AsyncMock,
     ) -> None:
         with pytest.raises(Exception) as exc_info:
             await verify_api_token(mock_request, app_settings_test, auth_token="test-token")
 
         assert "Database error" in str(exc_info.value)
 
+    @pytest.mark.parametrize("mock_decode_token", ["error"], indirect=True)
     async def test_verify_api_token_decode_error(
         self,
         app_settings_test: AppSettings,
-        mock_request: MagicMock,
-        mock_decode_token__error: MagicMock,
+        mock_request: MockRequest,
+        mock_decode_token: Callable[..., SimpleNamespace],
     ) -> None:
         with pytest.raises(HTTPException) as exc_info:
             await verify_api_token(mock_request, app_settings_test, auth_token="test-token")